@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+多语言消息表检查脚本
+1. 检查 i18n_messages.py 中的字典字面量是否存在重复的键。
+   重复的键在 Python 中会被后一次定义静默覆盖，修改前一处不会生效。
+2. 检查是否有消息键在模板、Python 代码和静态脚本中都没有被引用。
+   消息键都以字符串字面量出现（包括 category_key_map 之类的映射表），
+   因此只要源码中找不到带引号的键名，即可认为该消息已无用。
+提交修改消息表前运行：python check_i18n_messages.py
+"""
+
+import ast
+import glob
+import os
+import re
+import sys
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+MESSAGES_FILE = os.path.join(BASE_DIR, 'i18n_messages.py')
+# 可能引用消息键的源文件
+SOURCE_PATTERNS = ['*.py', 'api/*.py', 'templates/**/*.html', 'static/**/*.js']
+QUOTED_NAME_RE = re.compile(r"""['"]([A-Za-z0-9_]+)['"]""")
+
+
+def find_duplicate_keys(source, filename=MESSAGES_FILE):
+    """返回源码中所有字典字面量里的重复键，格式为 [(键, 首次行号, 重复行号)]"""
+    tree = ast.parse(source, filename)
+    duplicates = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Dict):
+            continue
+        seen = {}
+        for key in node.keys:
+            if not isinstance(key, ast.Constant):
+                continue
+            if key.value in seen:
+                duplicates.append((key.value, seen[key.value], key.lineno))
+            else:
+                seen[key.value] = key.lineno
+    return duplicates
+
+
+def find_unused_keys(messages):
+    """返回源码中没有以字符串字面量出现过的消息键"""
+    referenced = set()
+    for pattern in SOURCE_PATTERNS:
+        for path in glob.glob(os.path.join(BASE_DIR, pattern), recursive=True):
+            if os.path.abspath(path) == MESSAGES_FILE:
+                continue
+            with open(path, encoding='utf-8', errors='ignore') as f:
+                referenced.update(QUOTED_NAME_RE.findall(f.read()))
+    return [key for key in messages if key not in referenced]
+
+
+def main():
+    with open(MESSAGES_FILE, encoding='utf-8') as f:
+        duplicates = find_duplicate_keys(f.read())
+    for key, first_lineno, lineno in sorted(duplicates, key=lambda item: item[2]):
+        print(f"❌ 重复的键 {key!r}: 第 {lineno} 行（首次定义于第 {first_lineno} 行）")
+
+    from i18n_messages import MESSAGES
+    unused = find_unused_keys(MESSAGES)
+    for key in unused:
+        print(f"❌ 未被引用的键 {key!r}")
+
+    if duplicates or unused:
+        return 1
+    print(f"✅ 消息表检查通过（共 {len(MESSAGES)} 个键）")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
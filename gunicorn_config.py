@@ -1,4 +1,5 @@
 # Gunicorn配置文件
+import gc
 import os
 
 # 绑定地址和端口
@@ -22,6 +23,11 @@ loglevel = "info"
 # 预加载应用
 preload_app = True
 
+# fork 前冻结主进程中已加载的对象（多语言消息表等），
+# 避免 worker 的垃圾回收改写这些对象头导致写时复制共享的内存页被复制
+def pre_fork(server, worker):
+    gc.freeze()
+
 # 最大请求数
 max_requests = 1000
 max_requests_jitter = 50
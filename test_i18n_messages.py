@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import ast
+
+from check_i18n_messages import MESSAGES_FILE, find_duplicate_keys
+
+
+def test_no_duplicate_message_keys():
+    with open(MESSAGES_FILE, encoding='utf-8') as f:
+        source = f.read()
+
+    # MESSAGES 字面量中的顶层键不能重复
+    tree = ast.parse(source, MESSAGES_FILE)
+    messages_node = next(
+        node.value for node in tree.body
+        if isinstance(node, ast.Assign) and any(getattr(target, 'id', None) == 'MESSAGES' for target in node.targets)
+    )
+    keys = [key.value for key in messages_node.keys]
+    assert len(keys) == len(set(keys)), "MESSAGES 中存在重复的消息键"
+
+    # 各语言的内层字典同样不能重复
+    assert find_duplicate_keys(source) == []
+    print(f"✓ {len(keys)} 个消息键均无重复")
+
+
+if __name__ == '__main__':
+    test_no_duplicate_message_keys()